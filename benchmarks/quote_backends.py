@@ -0,0 +1,107 @@
+"""Compare startup time and memory of the stocks panel quote backends.
+
+Each backend is measured in a fresh Python process so import costs are not
+shared. Quotes are served by a local stub server that mimics Yahoo's chart
+JSON, so the numbers do not depend on the network.
+
+Usage:
+    python3 benchmarks/quote_backends.py [--symbols AAPL,GOOGL,TSLA] [--rounds 20]
+"""
+import argparse
+import importlib.util
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DASHBOARD_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tui-dashboard.py')
+
+class StubQuoteHandler(BaseHTTPRequestHandler):
+    """Answer every chart request with a fixed quote."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, so pooled connections are actually reused
+    disable_nagle_algorithm = True  # Headers and body go out in separate writes
+
+    def do_GET(self):
+        symbol = self.path.split('?')[0].rstrip('/').rsplit('/', 1)[-1]
+        body = json.dumps({
+            "chart": {"result": [{"meta": {"symbol": symbol, "regularMarketPrice": 123.45}}], "error": None}
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep the benchmark output clean
+
+def run_child(backend_name, quote_url, symbols, rounds):
+    """Measure one backend inside this process and print the results as JSON."""
+    start = time.perf_counter()
+    spec = importlib.util.spec_from_file_location("tui_dashboard", DASHBOARD_PATH)
+    dashboard = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(dashboard)
+
+    if backend_name == dashboard.YFinanceQuoteBackend.name:
+        backend = dashboard.YFinanceQuoteBackend()
+    else:
+        backend = dashboard.HTTPQuoteBackend(base_url=quote_url)
+    startup = time.perf_counter() - start
+
+    fetch = None
+    if backend_name == dashboard.HTTPQuoteBackend.name:
+        # yfinance always talks to Yahoo directly, so only the HTTP backend can use the stub
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for symbol in symbols:
+                backend.get_price(symbol)
+        fetch = (time.perf_counter() - start) / (rounds * len(symbols))
+
+    print(json.dumps({
+        "startup": startup,
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "fetch": fetch,
+    }))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the stocks panel quote backends")
+    parser.add_argument('--symbols', default="AAPL,GOOGL,TSLA", help="Comma-separated stock symbols")
+    parser.add_argument('--rounds', type=int, default=20, help="Times each symbol is fetched")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--quote-url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    symbols = [symbol.strip() for symbol in args.symbols.split(",") if symbol.strip()]
+
+    if args.child:
+        run_child(args.child, args.quote_url, symbols, args.rounds)
+        return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubQuoteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    quote_url = f"http://127.0.0.1:{server.server_address[1]}/v8/finance/chart/"
+
+    print(f"{'Backend':<10} {'Startup':>10} {'Max RSS':>10} {'Per quote':>10}")
+    for backend_name in ("http", "yfinance"):
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', backend_name,
+             '--quote-url', quote_url, '--symbols', args.symbols, '--rounds', str(args.rounds)],
+            capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed"
+            print(f"{backend_name:<10} unavailable ({error})")
+            continue
+
+        stats = json.loads(result.stdout.strip().splitlines()[-1])
+        fetch = f"{stats['fetch'] * 1000:.2f}ms" if stats['fetch'] is not None else "n/a"
+        print(f"{backend_name:<10} {stats['startup'] * 1000:>8.0f}ms {stats['max_rss_kb'] / 1024:>8.1f}MB {fetch:>10}")
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
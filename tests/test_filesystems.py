@@ -0,0 +1,98 @@
+"""Check that a hanging mount is marked stuck without blocking the dashboard.
+
+Run with:
+    python3 -m unittest discover tests
+"""
+import collections
+import importlib.util
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+DASHBOARD_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tui-dashboard.py')
+
+spec = importlib.util.spec_from_file_location("tui_dashboard", DASHBOARD_PATH)
+dashboard = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(dashboard)
+
+Partition = collections.namedtuple('Partition', 'device mountpoint fstype')
+Usage = collections.namedtuple('Usage', 'total used free percent')
+DiskIO = collections.namedtuple('DiskIO', 'read_bytes write_bytes')
+
+class HangingMountTest(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.calls = collections.Counter()
+
+        def disk_usage(mountpoint):
+            self.calls[mountpoint] += 1
+            if mountpoint == '/mnt/nas':
+                self.release.wait()  # Simulate an NFS server that stopped answering
+            return Usage(100 * 1024 ** 3, 40 * 1024 ** 3, 60 * 1024 ** 3, 40.0)
+
+        partitions = [
+            Partition('overlay', '/', 'overlay'),
+            Partition('nas:/export', '/mnt/nas', 'nfs4'),
+            Partition('proc', '/proc', 'proc'),
+        ]
+        patches = [
+            mock.patch.object(dashboard.psutil, 'disk_partitions', lambda all=False: partitions),
+            mock.patch.object(dashboard.psutil, 'disk_usage', disk_usage),
+            mock.patch.object(dashboard.psutil, 'disk_io_counters',
+                              lambda perdisk=False: {'sda': DiskIO(0, 0), 'loop0': DiskIO(0, 0),
+                                                     'zram0': DiskIO(0, 0), 'ram0': DiskIO(0, 0)}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(self.release.set)  # Let the stuck worker thread finish
+
+        self.collector = dashboard.FilesystemCollector()
+        self.collector.STATVFS_TIMEOUT = 0.2
+
+    def test_hanging_mount_is_marked_stuck_without_blocking(self):
+        start = time.monotonic()
+        self.collector.collect()
+        self.assertLess(time.monotonic() - start, self.collector.STATVFS_TIMEOUT / 2)
+
+        time.sleep(self.collector.STATVFS_TIMEOUT * 1.5)
+        for _ in range(5):
+            start = time.monotonic()
+            self.collector.collect()
+            self.assertLess(time.monotonic() - start, self.collector.STATVFS_TIMEOUT / 2)
+
+        mounts, usage, stuck, io_rates = self.collector.snapshot()
+        self.assertIn('/mnt/nas', stuck)
+        self.assertNotIn('/mnt/nas', usage)
+        self.assertEqual(usage['/'].percent, 40.0)
+        self.assertNotIn('/proc', mounts)
+        self.assertEqual(set(io_rates), {'sda'})
+
+        # The hung worker is never joined by a second one
+        self.assertEqual(self.calls['/mnt/nas'], 1)
+
+        app = dashboard.DashboardApp.__new__(dashboard.DashboardApp)
+        app.fs_collector = self.collector
+        panel = app.filesystems_info()
+        self.assertIn("/mnt/nas (nfs4): STUCK", panel)
+        self.assertIn("/ (overlay): 40.0%", panel)
+
+    def test_unmounted_stuck_mount_is_pruned(self):
+        self.collector.collect()
+        time.sleep(self.collector.STATVFS_TIMEOUT * 1.5)
+        self.collector.collect()
+        self.assertIn('/mnt/nas', self.collector.snapshot()[2])
+
+        with mock.patch.object(dashboard.psutil, 'disk_partitions',
+                               lambda all=False: [Partition('overlay', '/', 'overlay')]):
+            self.collector.refresh_mounts()
+
+        mounts, usage, stuck, io_rates = self.collector.snapshot()
+        self.assertNotIn('/mnt/nas', mounts)
+        self.assertNotIn('/mnt/nas', stuck)
+        self.assertNotIn('/mnt/nas', self.collector.in_flight)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""Check forecast parsing, local interpolation and the forecast refresh schedule.
+
+Run with:
+    python3 -m unittest discover tests
+"""
+import importlib.util
+import os
+import re
+import time
+import types
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+DASHBOARD_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tui-dashboard.py')
+
+spec = importlib.util.spec_from_file_location("tui_dashboard", DASHBOARD_PATH)
+dashboard = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(dashboard)
+
+# New York on 2026-10-19 is UTC-4, so 10:30 local is 14:30 UTC
+NOW = datetime(2026, 10, 19, 14, 30, tzinfo=timezone.utc).timestamp()
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+J1_PAYLOAD = {
+    "current_condition": [{"localObsDateTime": "2026-10-19 10:12 AM", "observation_time": "02:12 PM"}],
+    "weather": [
+        {
+            "date": date,
+            "astronomy": [{"sunrise": "07:12 AM", "sunset": "06:10 PM"}],
+            "hourly": [
+                {
+                    "time": str(hour * 100),
+                    "tempC": str(6 + hour),
+                    "humidity": "60",
+                    "windspeedKmph": "10",
+                    "weatherDesc": [{"value": "Light rain "}],
+                }
+                for hour in range(0, 24, 3)
+            ],
+        }
+        for date in ("2026-10-19", "2026-10-20")
+    ],
+}
+
+OPEN_METEO_START = utc(2026, 10, 19, 0)
+OPEN_METEO_PAYLOAD = {
+    "hourly": {
+        "time": [OPEN_METEO_START + i * 3600 for i in range(48)],
+        "temperature_2m": [10 + i * 0.5 for i in range(48)],
+        "relative_humidity_2m": [85] * 48,
+        "wind_speed_10m": [25] * 48,
+        "weather_code": [61] * 48,
+    },
+    "daily": {"sunrise": [utc(2026, 10, 19, 11, 12)], "sunset": [utc(2026, 10, 19, 22, 10)]},
+}
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+class WeatherForecastTest(unittest.TestCase):
+    def setUp(self):
+        self.requested = []
+        self.wttr_available = True
+
+        def get(url, params=None, timeout=None):
+            self.requested.append(url)
+            if 'ipinfo' in url:
+                return FakeResponse(200, {"city": "New York", "country": "US", "loc": "40.7,-74.0"})
+            if 'wttr' in url:
+                return FakeResponse(200, J1_PAYLOAD) if self.wttr_available else FakeResponse(503)
+            return FakeResponse(200, OPEN_METEO_PAYLOAD)
+
+        fake_time = types.SimpleNamespace(time=lambda: NOW, sleep=time.sleep)
+        patches = [
+            mock.patch.object(dashboard.requests, 'get', get),
+            mock.patch.object(dashboard, 'time', fake_time),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.app = dashboard.DashboardApp.__new__(dashboard.DashboardApp)
+        self.app.forecast = None
+        self.app.next_forecast_fetch = 0
+
+    def set_timezone(self, name):
+        old = os.environ.get('TZ')
+        os.environ['TZ'] = name
+        time.tzset()
+
+        def restore():
+            if old is None:
+                os.environ.pop('TZ', None)
+            else:
+                os.environ['TZ'] = old
+            time.tzset()
+        self.addCleanup(restore)
+
+    def test_interpolates_between_three_hourly_points(self):
+        points = self.app.fetch_forecast_from_wttr()["points"]
+        current = self.app.interpolate_forecast(points, NOW)
+        # 09:00 local is 15°C and 12:00 local is 18°C, so 10:30 is halfway
+        self.assertAlmostEqual(current["temp"], 16.5)
+        self.assertAlmostEqual(current["humidity"], 60)
+        self.assertEqual(current["condition"], "Light rain")
+
+    def test_outside_forecast_range_is_none(self):
+        points = self.app.fetch_forecast_from_wttr()["points"]
+        self.assertIsNone(self.app.interpolate_forecast(points, points[0]["time"] - 1))
+        self.assertIsNone(self.app.interpolate_forecast(points, points[-1]["time"] + 1))
+        self.assertIsNone(self.app.interpolate_forecast([], NOW))
+
+    def test_wttr_times_use_location_timezone(self):
+        results = []
+        for name in ("UTC", "America/New_York", "Europe/London"):
+            self.set_timezone(name)
+            results.append([point["time"] for point in self.app.fetch_forecast_from_wttr()["points"]])
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+        # 2026-10-19 00:00 in New York is 04:00 UTC
+        self.assertEqual(results[0][0], utc(2026, 10, 19, 4))
+
+    def test_refresh_resamples_hours_with_precomputed_clothing(self):
+        self.assertTrue(self.app.refresh_forecast())
+        forecast = self.app.forecast
+        hours = forecast["hours"]
+
+        self.assertEqual(forecast["source"], "wttr.in")
+        self.assertEqual(forecast["location"], "New York, US")
+        self.assertEqual(len(hours), self.app.FORECAST_HOURS + 1)
+        self.assertEqual(hours[0]["time"], utc(2026, 10, 19, 14))
+        self.assertEqual([hour["time"] - hours[0]["time"] for hour in hours[:3]], [0, 3600, 7200])
+        self.assertAlmostEqual(hours[0]["temp"], 16)
+        self.assertAlmostEqual(hours[1]["temp"], 17)
+        for hour in hours:
+            self.assertEqual(hour["clothing"], self.app.get_clothing_suggestion(
+                hour["condition"], hour["temp"], hour["humidity"], hour["wind"]
+            ))
+        self.assertIn("umbrella", hours[0]["clothing"])
+
+        panel = self.app.weather_info()
+        self.assertIn("(16.5°C)", panel)
+        self.assertIn(hours[0]["clothing"], panel)
+        strip = re.search(r"Next hours: (.*)", panel).group(1)
+        self.assertEqual(len(strip.split("° ")), self.app.FORECAST_STRIP_HOURS)
+
+    def test_falls_back_to_open_meteo(self):
+        self.wttr_available = False
+        self.assertTrue(self.app.refresh_forecast())
+        forecast = self.app.forecast
+
+        self.assertEqual(forecast["source"], "Open-Meteo")
+        self.assertEqual(forecast["points"][0]["condition"], "Slight rain")
+        current = self.app.interpolate_forecast(forecast["points"], NOW)
+        # 14:30 UTC is 14.5 hours after the first point
+        self.assertAlmostEqual(current["temp"], 10 + 14.5 * 0.5)
+        self.assertAlmostEqual(current["humidity"], 85)
+
+    def test_second_update_inside_refresh_window_makes_no_requests(self):
+        self.app.update_forecast()
+        self.assertEqual(len(self.requested), 2)  # ipinfo and wttr.in
+
+        self.app.update_forecast()
+        self.assertEqual(len(self.requested), 2)
+        self.assertEqual(self.app.next_forecast_fetch, NOW + self.app.FORECAST_REFRESH)
+
+if __name__ == "__main__":
+    unittest.main()
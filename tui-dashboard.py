@@ -2,34 +2,244 @@ import curses
 import psutil
 import time
 import requests
-import yfinance as yf
 import os
 import configparser
 import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import socket
 import threading
 import sys
 import argparse
+from abc import ABC, abstractmethod
+
+class FilesystemCollector:
+    """Collect usage for every mount without letting a hung mount block the UI."""
+
+    # Pseudo filesystems that are not worth showing in the panel
+    IGNORED_FSTYPES = {
+        "proc", "sysfs", "devtmpfs", "devpts", "tmpfs", "cgroup", "cgroup2",
+        "securityfs", "pstore", "debugfs", "tracefs", "configfs", "fusectl",
+        "mqueue", "hugetlbfs", "bpf", "autofs", "binfmt_misc", "rpc_pipefs",
+        "nsfs", "efivarfs", "ramfs", "squashfs", "overlay", "fuse.portal",
+        "fuse.gvfsd-fuse",
+    }
+    # Network filesystems are the ones likely to hang, so poll them less often
+    NETWORK_FSTYPES = {"nfs", "nfs4", "cifs", "smbfs", "smb3", "fuse.sshfs", "sshfs", "9p"}
+    # Virtual block devices (snap loop mounts, ramdisks, zram swap) that would flood the I/O rates
+    IGNORED_DEVICE_PREFIXES = ("loop", "ram", "zram")
+
+    LOCAL_REFRESH = 30      # Seconds between statvfs calls on local mounts
+    NETWORK_REFRESH = 120   # Seconds between statvfs calls on network mounts
+    # Seconds to wait before the next statvfs once a stuck mount's worker finally returns.
+    # A hung mount is never re-checked while its worker is still in flight; do not start a second one.
+    STUCK_RETRY = 300
+    STATVFS_TIMEOUT = 2     # Seconds a statvfs call may take before the mount is marked stuck
+    MOUNTS_REFRESH = 60     # Seconds between re-reading the mount table
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.mounts = {}       # mountpoint -> fstype
+        self.usage = {}        # mountpoint -> psutil disk usage result
+        self.next_check = {}   # mountpoint -> time of the next statvfs call
+        self.in_flight = {}    # mountpoint -> time the running statvfs started
+        self.stuck = {}        # mountpoint -> time the mount was marked stuck
+        self.io_rates = {}     # device -> (read bytes/s, write bytes/s)
+        self.last_io = None
+        self.last_io_time = None
+        self.last_mounts_update = 0
+
+    def refresh_mounts(self):
+        """Re-read the mount table; this does not touch the mounts themselves."""
+        try:
+            partitions = psutil.disk_partitions(all=True)
+        except Exception:
+            return
+
+        mounts = {}
+        for part in partitions:
+            # Always keep the root mount, which may be overlay on containers and read-only kiosks
+            if part.mountpoint != '/' and (part.fstype in self.IGNORED_FSTYPES or not part.fstype):
+                continue
+            mounts[part.mountpoint] = part.fstype
+
+        with self.lock:
+            self.mounts = mounts
+            tracked = set(self.usage) | set(self.next_check) | set(self.in_flight) | set(self.stuck)
+            for mountpoint in tracked - set(mounts):
+                self.usage.pop(mountpoint, None)
+                self.next_check.pop(mountpoint, None)
+                self.in_flight.pop(mountpoint, None)
+                self.stuck.pop(mountpoint, None)
+        self.last_mounts_update = time.time()
+
+    def check_mount(self, mountpoint):
+        """Run statvfs on one mount; meant to run in its own worker thread."""
+        try:
+            usage = psutil.disk_usage(mountpoint)
+        except Exception:
+            usage = None
+
+        with self.lock:
+            self.in_flight.pop(mountpoint, None)
+            self.stuck.pop(mountpoint, None)
+            if usage is not None:
+                self.usage[mountpoint] = usage
+            else:
+                self.usage.pop(mountpoint, None)
+
+    def refresh_usage(self):
+        """Start statvfs workers for mounts that are due and mark slow ones as stuck."""
+        now = time.time()
+        with self.lock:
+            for mountpoint, started in self.in_flight.items():
+                if now - started > self.STATVFS_TIMEOUT and mountpoint not in self.stuck:
+                    self.stuck[mountpoint] = now
+                    self.next_check[mountpoint] = now + self.STUCK_RETRY
+
+            due = []
+            for mountpoint, fstype in self.mounts.items():
+                # Never stack a second worker on a mount whose last call has not returned
+                if mountpoint in self.in_flight or now < self.next_check.get(mountpoint, 0):
+                    continue
+                interval = self.NETWORK_REFRESH if fstype in self.NETWORK_FSTYPES else self.LOCAL_REFRESH
+                self.next_check[mountpoint] = now + interval
+                self.in_flight[mountpoint] = now
+                due.append(mountpoint)
+
+        for mountpoint in due:
+            threading.Thread(target=self.check_mount, args=(mountpoint,), daemon=True).start()
+
+    def refresh_io(self):
+        """Compute per-device read/write rates from the disk I/O counters."""
+        try:
+            counters = psutil.disk_io_counters(perdisk=True) or {}
+        except Exception:
+            return
+
+        now = time.time()
+        rates = {}
+        if self.last_io is not None:
+            elapsed = now - self.last_io_time
+            if elapsed > 0:
+                for device, io in counters.items():
+                    if device.startswith(self.IGNORED_DEVICE_PREFIXES):
+                        continue
+                    previous = self.last_io.get(device)
+                    if previous is None:
+                        continue
+                    read_rate = max(0, io.read_bytes - previous.read_bytes) / elapsed
+                    write_rate = max(0, io.write_bytes - previous.write_bytes) / elapsed
+                    rates[device] = (read_rate, write_rate)
+
+        self.last_io = counters
+        self.last_io_time = now
+        with self.lock:
+            self.io_rates = rates
+
+    def collect(self):
+        """Run one collection pass; never blocks on a mount."""
+        if time.time() - self.last_mounts_update >= self.MOUNTS_REFRESH:
+            self.refresh_mounts()
+        self.refresh_usage()
+        self.refresh_io()
+
+    def disk_percent(self, mountpoint):
+        """Return the cached usage percent for a mount, or None if unknown."""
+        with self.lock:
+            usage = self.usage.get(mountpoint)
+        return usage.percent if usage is not None else None
+
+    def snapshot(self):
+        """Return a consistent copy of the cached mounts, usage, stuck mounts and I/O rates."""
+        now = time.time()
+        with self.lock:
+            stuck = {mountpoint: now - self.in_flight.get(mountpoint, marked)
+                     for mountpoint, marked in self.stuck.items()}
+            return dict(self.mounts), dict(self.usage), stuck, dict(self.io_rates)
+
+class QuoteBackend(ABC):
+    """Base class for stock quote sources used by the stocks panel."""
+
+    name = None
+
+    @abstractmethod
+    def get_price(self, symbol):
+        """Return the latest price for a symbol, or None if it is not available."""
+
+class HTTPQuoteBackend(QuoteBackend):
+    """Fetch quotes as plain JSON from Yahoo's chart endpoint over a pooled session."""
+
+    name = "http"
+    DEFAULT_URL = "https://query1.finance.yahoo.com/v8/finance/chart/"
+
+    def __init__(self, base_url=None, timeout=5):
+        self.base_url = (base_url or self.DEFAULT_URL).rstrip('/') + '/'
+        self.timeout = timeout
+        # One session for every request so the connection to the quote host is reused
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "Mozilla/5.0 (DashboardApp)"})
+
+    def get_price(self, symbol):
+        try:
+            res = self.session.get(
+                self.base_url + symbol,
+                params={"range": "1d", "interval": "1d"},
+                timeout=self.timeout,
+            )
+            if res.status_code != 200:
+                return None
+            meta = res.json()['chart']['result'][0]['meta']
+            return float(meta['regularMarketPrice'])
+        except (requests.RequestException, ValueError, KeyError, IndexError, TypeError):
+            return None
+
+class YFinanceQuoteBackend(QuoteBackend):
+    """Fetch quotes with yfinance; pulls in pandas and NumPy, so it is only imported when selected."""
+
+    name = "yfinance"
+
+    def __init__(self):
+        import yfinance
+        self.yf = yfinance
+
+    def get_price(self, symbol):
+        try:
+            return float(self.yf.Ticker(symbol).history(period="1d")['Close'].iloc[-1])
+        except Exception:
+            # yfinance can raise almost anything on network or parse errors; never kill the refresh thread
+            return None
 
 class DashboardApp:
+    FORECAST_REFRESH = 3 * 3600   # Seconds between forecast downloads
+    FORECAST_RETRY = 10 * 60      # Seconds before retrying a failed forecast download
+    FORECAST_HOURS = 24           # Hours of forecast to resample and precompute clothing for
+    FORECAST_STRIP_HOURS = 4      # Hours shown in the next-hours strip; more don't fit the 50-column box
+
     def __init__(self, stdscr):
         self.stdscr = stdscr
         self.monocle_mode = False
         self.active_window = 0
-        self.windows = [self.system_info, self.weather_info, self.tasks_info, self.stocks_info]
-        self.window_titles = ["System Info", "Weather Info", "Tasks", "Stocks"]
+        self.windows = [self.system_info, self.weather_info, self.tasks_info, self.stocks_info, self.filesystems_info]
+        self.window_titles = ["System Info", "Weather Info", "Tasks", "Stocks", "Filesystems"]
         self.setup_curses()
         self.config_file = os.path.expanduser('~/.config/dailyapp/conf.conf')
         self.ensure_config_file()
         self.is_raspberry_pi = self.check_if_raspberry_pi()
+        self.fs_collector = FilesystemCollector()
+        self.quote_backend = self.get_quote_backend()
+
+        # Fetch the forecast once up front; the weather panel is then interpolated from it
+        self.forecast = None
+        self.next_forecast_fetch = 0
+        self.update_forecast()
+        self.weather_data = self.weather_info()
 
         # Start auto-refresh threads
         threading.Thread(target=self.auto_refresh_weather, daemon=True).start()
         threading.Thread(target=self.auto_refresh_stocks, daemon=True).start()
+        threading.Thread(target=self.auto_refresh_filesystems, daemon=True).start()
 
         # Initialize dynamic data
-        self.weather_data = self.weather_info()
         self.stock_data = self.stocks_info()
         self.tasks_data = self.tasks_info()
         self.last_tasks_update = 0  # For updating tasks every 5 minutes
@@ -71,6 +281,25 @@ class DashboardApp:
         except (configparser.NoSectionError, configparser.NoOptionError):
             return []
 
+    def get_quote_backend(self):
+        """Build the quote backend named in the config file, defaulting to the lightweight HTTP one."""
+        config = configparser.ConfigParser()
+        config.read(self.config_file)
+        name = config.get("settings", "quote_backend", fallback=HTTPQuoteBackend.name).strip()
+        quote_url = config.get("settings", "quote_url", fallback="").strip() or None
+
+        # Shown in the Stocks panel so an ignored setting doesn't go unnoticed
+        self.quote_backend_notice = None
+        if name == YFinanceQuoteBackend.name:
+            try:
+                return YFinanceQuoteBackend()
+            except ImportError:
+                # yfinance is optional; fall back to the HTTP backend
+                self.quote_backend_notice = "yfinance not installed, using http"
+        elif name != HTTPQuoteBackend.name:
+            self.quote_backend_notice = f"Unknown quote_backend '{name}', using http"
+        return HTTPQuoteBackend(base_url=quote_url)
+
     def check_if_raspberry_pi(self):
         """Check if the system is a Raspberry Pi."""
         try:
@@ -80,10 +309,11 @@ class DashboardApp:
         except:
             return False
 
-    def get_ip_location(self):
+    def get_ip_location(self, ip_data=None):
         """Get user location based on their IP address."""
         try:
-            ip_data = requests.get("http://ipinfo.io").json()
+            if ip_data is None:
+                ip_data = requests.get("http://ipinfo.io").json()
             city = ip_data.get('city', 'Unknown')
             country = ip_data.get('country', 'Unknown')
             return f"{city}, {country}"
@@ -141,7 +371,8 @@ class DashboardApp:
         avg_load = os.getloadavg()
         memory = psutil.virtual_memory()
         swap = psutil.swap_memory()
-        disk = psutil.disk_usage('/')
+        disk_percent = self.fs_collector.disk_percent('/')  # Cached; never statvfs in the render path
+        disk_usage = f"{disk_percent}%" if disk_percent is not None else "N/A"
         uptime_seconds = time.time() - psutil.boot_time()
         uptime_string = time.strftime('%H:%M:%S', time.gmtime(uptime_seconds))
 
@@ -175,7 +406,7 @@ class DashboardApp:
         sys_info_lines.append(f"║ Memory Usage: {memory.percent}%                ")
 
         sys_info_lines.append(f"║ Swap Usage: {swap.percent}%                    ")
-        sys_info_lines.append(f"║ Disk Usage: {disk.percent}%                    ")
+        sys_info_lines.append(f"║ Disk Usage: {disk_usage}                    ")
 
         if self.is_raspberry_pi:
             # Get temperature (Raspberry Pi-specific)
@@ -229,129 +460,213 @@ class DashboardApp:
         else:
             return curses.color_pair(1)  # Green
 
-    def weather_info(self):
-        def fetch_from_wttr():
-            """Fetch weather from wttr.in."""
-            try:
-                location = self.get_ip_location()  # Get the location based on IP
-
-                res = requests.get('http://wttr.in/?format=%C+%t+%w+%h+%S+%s')
-                if res.status_code == 200:
-                    weather_data = res.text.strip().split()
-                    if len(weather_data) >= 6:
-                        condition = weather_data[0]
-                        temp = weather_data[1]
-                        wind = weather_data[2]
-                        humidity = weather_data[3]
-                        sunrise = weather_data[4]
-                        sunset = weather_data[5]
-
-                        # Enhanced clothing advice based on weather conditions
-                        temp_val = int(temp[:-1]) if '°C' in temp else int((float(temp[:-1]) - 32) * 5/9)
-                        humidity_val = int(humidity.replace('%', '')) if humidity != 'N/A' else 50
-                        wind_speed = int(wind[:-3]) if 'km/h' in wind else 0  # Get wind speed if available
-
-                        # Robust clothing suggestion logic
-                        clothing = self.get_clothing_suggestion(condition, temp_val, humidity_val, wind_speed)
-
-                        date_str = datetime.now().strftime('%m/%d/%Y')
-                        time_str = datetime.now().strftime('%H:%M')
-
-                        return f"""
-╔════════════════════════════════════════════════╗
-║                Weather Information             ║
-╠════════════════════════════════════════════════╣
-║                                                ║
-║ Location: {location}                           
-║ Date: {date_str} - {time_str}                  
-║ Condition: {condition}                         
-║ Temperature: {temp}                            
-║ Wind: {wind}                                   
-║ Humidity: {humidity}                           
-║ Sunrise: {sunrise}                             
-║ Sunset: {sunset}                               
-║                                                ║
-║ ────────────────────────────────────────────── ║
-║ Recommended Clothing:                          ║
-║ {clothing}                                     
-╚════════════════════════════════════════════════╝
-"""
-                    else:
-                        return None
-                else:
-                    return None
-            except:
+    def get_wttr_timezone(self, current):
+        """Work out the forecast location's UTC offset from wttr.in's current observation."""
+        # localObsDateTime is in the location's local time, observation_time is UTC (time of day only)
+        local_obs = datetime.strptime(current['localObsDateTime'], '%Y-%m-%d %I:%M %p')
+        utc_time = datetime.strptime(current['observation_time'], '%I:%M %p').time()
+        for day_shift in (0, -1, 1):
+            utc_obs = datetime.combine(local_obs.date() + timedelta(days=day_shift), utc_time)
+            offset = local_obs - utc_obs
+            if timedelta(hours=-12) <= offset <= timedelta(hours=14):
+                # Real offsets are whole quarter hours; drop any rounding in the observation times
+                quarters = round(offset.total_seconds() / 900)
+                return timezone(timedelta(minutes=15 * quarters))
+        raise ValueError("Could not determine the wttr.in location's UTC offset")
+
+    def fetch_forecast_from_wttr(self):
+        """Fetch the hourly forecast from wttr.in's JSON format (3-hourly steps)."""
+        try:
+            res = requests.get('http://wttr.in/?format=j1', timeout=10)
+            if res.status_code != 200:
+                return None
+            data = res.json()
+            location_tz = self.get_wttr_timezone(data['current_condition'][0])
+
+            points = []
+            for day in data['weather']:
+                for hour in day['hourly']:
+                    # Times are "0", "300", ... "2100" in the location's local time, not the machine's
+                    hour_of_day = int(hour['time']) // 100
+                    when = datetime.strptime(f"{day['date']} {hour_of_day:02d}", '%Y-%m-%d %H')
+                    when = when.replace(tzinfo=location_tz)
+                    points.append({
+                        "time": when.timestamp(),
+                        "temp": float(hour['tempC']),
+                        "humidity": float(hour['humidity']),
+                        "wind": float(hour['windspeedKmph']),
+                        "condition": hour['weatherDesc'][0]['value'].strip(),
+                    })
+
+            astronomy = data['weather'][0]['astronomy'][0]
+            return {
+                "source": "wttr.in",
+                "points": points,
+                "sunrise": astronomy.get('sunrise', 'N/A'),
+                "sunset": astronomy.get('sunset', 'N/A'),
+            }
+        except:
+            return None
+
+    def fetch_forecast_from_open_meteo(self, lat, lon):
+        """Fetch the hourly forecast from Open-Meteo."""
+        try:
+            res = requests.get(
+                'https://api.open-meteo.com/v1/forecast',
+                params={
+                    "latitude": lat,
+                    "longitude": lon,
+                    "hourly": "temperature_2m,relative_humidity_2m,wind_speed_10m,weather_code",
+                    "daily": "sunrise,sunset",
+                    "timezone": "auto",
+                    "timeformat": "unixtime",
+                    "forecast_days": 2,
+                },
+                timeout=10,
+            )
+            if res.status_code != 200:
                 return None
+            data = res.json()
+
+            hourly = data['hourly']
+            points = []
+            for i, when in enumerate(hourly['time']):
+                points.append({
+                    "time": float(when),
+                    "temp": float(hourly['temperature_2m'][i]),
+                    "humidity": float(hourly['relative_humidity_2m'][i]),
+                    "wind": float(hourly['wind_speed_10m'][i]),
+                    "condition": self.get_condition_from_code(hourly['weather_code'][i]),
+                })
+
+            daily = data['daily']
+            return {
+                "source": "Open-Meteo",
+                "points": points,
+                "sunrise": datetime.fromtimestamp(daily['sunrise'][0]).strftime('%H:%M'),
+                "sunset": datetime.fromtimestamp(daily['sunset'][0]).strftime('%H:%M'),
+            }
+        except:
+            return None
+
+    def interpolate_forecast(self, points, when):
+        """Linearly interpolate temperature, humidity and wind at a given time from forecast points."""
+        if not points or when < points[0]["time"] or when > points[-1]["time"]:
+            return None
+
+        for before, after in zip(points, points[1:]):
+            if before["time"] <= when <= after["time"]:
+                span = after["time"] - before["time"]
+                ratio = (when - before["time"]) / span if span else 0
+                return {
+                    "time": when,
+                    "temp": before["temp"] + (after["temp"] - before["temp"]) * ratio,
+                    "humidity": before["humidity"] + (after["humidity"] - before["humidity"]) * ratio,
+                    "wind": before["wind"] + (after["wind"] - before["wind"]) * ratio,
+                    # Conditions can't be blended, so take the closer forecast point
+                    "condition": before["condition"] if ratio < 0.5 else after["condition"],
+                }
+        return dict(points[-1])
+
+    def refresh_forecast(self):
+        """Fetch and cache an hourly forecast, with clothing precomputed for the coming hours."""
+        try:
+            ip_data = requests.get("http://ipinfo.io", timeout=10).json()
+        except:
+            ip_data = None
+        location = self.get_ip_location(ip_data)
+
+        # Try wttr.in first, then fall back to Open-Meteo
+        forecast = self.fetch_forecast_from_wttr()
+        if forecast is None:
+            lat, lon = self.get_lat_lon_from_ip(ip_data)
+            forecast = self.fetch_forecast_from_open_meteo(lat, lon)
+        if forecast is None:
+            return False
 
-        def fetch_from_open_meteo():
-            """Fetch weather from Open-Meteo."""
-            try:
-                # Get latitude and longitude from the IP
-                lat, lon = self.get_lat_lon_from_ip()
-                location = self.get_ip_location()  # Get the location using IP, not from the API
-
-                res = requests.get(f'https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current_weather=true')
-                if res.status_code == 200:
-                    data = res.json()['current_weather']
-                    temp_celsius = data['temperature']
-                    temp_fahrenheit = (temp_celsius * 9/5) + 32  # Convert to Fahrenheit
-                    wind_speed = data['windspeed']
-                    condition_code = data.get('weathercode', 0)
-
-                    # Map weather codes to conditions
-                    condition = self.get_condition_from_code(condition_code)
-
-                    # Humidity is not provided by Open-Meteo free tier, so we'll set it as "N/A"
-                    humidity = "N/A"
-
-                    # Robust clothing suggestion logic
-                    temp_val = temp_celsius
-                    humidity_val = 50  # Default value
-                    wind_speed_val = wind_speed
-                    clothing = self.get_clothing_suggestion(condition, temp_val, humidity_val, wind_speed_val)
-
-                    date_str = datetime.now().strftime('%m/%d/%Y')
-                    time_str = datetime.now().strftime('%H:%M')
-
-                    return f"""
+        points = sorted(forecast["points"], key=lambda point: point["time"])
+
+        # Resample to whole hours so the next-hours strip and clothing advice line up
+        hours = []
+        start_hour = int(time.time() // 3600) * 3600
+        for i in range(self.FORECAST_HOURS + 1):
+            hour = self.interpolate_forecast(points, start_hour + i * 3600)
+            if hour is None:
+                continue
+            hour["clothing"] = self.get_clothing_suggestion(
+                hour["condition"], hour["temp"], hour["humidity"], hour["wind"]
+            )
+            hours.append(hour)
+
+        forecast.update({"points": points, "hours": hours, "location": location, "fetched": time.time()})
+        self.forecast = forecast
+        return True
+
+    def update_forecast(self):
+        """Download a new forecast if the cached one is due; failures keep the old one and retry sooner."""
+        if time.time() < self.next_forecast_fetch:
+            return
+        if self.refresh_forecast():
+            self.next_forecast_fetch = time.time() + self.FORECAST_REFRESH
+        else:
+            self.next_forecast_fetch = time.time() + self.FORECAST_RETRY
+
+    def weather_info(self):
+        """Render current weather by interpolating the cached forecast; makes no network requests."""
+        forecast = self.forecast
+        now = time.time()
+        current = self.interpolate_forecast(forecast["points"], now) if forecast else None
+        if current is None:
+            return "Weather data unavailable from both sources."
+
+        # Clothing advice was precomputed per hour when the forecast was fetched
+        clothing = ""
+        for hour in forecast["hours"]:
+            if hour["time"] <= now:
+                clothing = hour["clothing"]
+        if not clothing:
+            clothing = self.get_clothing_suggestion(
+                current["condition"], current["temp"], current["humidity"], current["wind"]
+            )
+
+        upcoming = [hour for hour in forecast["hours"] if hour["time"] > now][:self.FORECAST_STRIP_HOURS]
+        strip = " ".join(
+            f"{datetime.fromtimestamp(hour['time']).strftime('%H')}h {hour['temp']:.0f}°" for hour in upcoming
+        )
+
+        temp_celsius = current["temp"]
+        temp_fahrenheit = (temp_celsius * 9/5) + 32  # Convert to Fahrenheit
+        date_str = datetime.now().strftime('%m/%d/%Y')
+        time_str = datetime.now().strftime('%H:%M')
+        fetched_str = datetime.fromtimestamp(forecast["fetched"]).strftime('%H:%M')
+
+        return f"""
 ╔════════════════════════════════════════════════╗
 ║                Weather Information             ║
 ╠════════════════════════════════════════════════╣
 ║                                                ║
-║ Location:       {location}                     
+║ Location:       {forecast['location']}                     
 ║ Date:           {date_str} - {time_str}        
-║ Condition:      {condition}                    
+║ Condition:      {current['condition']}                    
 ║ Temperature:    {temp_fahrenheit:.1f}°F ({temp_celsius:.1f}°C) 
-║ Wind:           {wind_speed} km/h              
-║ Humidity:       {humidity}                     
+║ Wind:           {current['wind']:.0f} km/h              
+║ Humidity:       {current['humidity']:.0f}%                     
+║ Sunrise:        {forecast['sunrise']}                             
+║ Sunset:         {forecast['sunset']}                               
+║ Forecast:       {forecast['source']} at {fetched_str}              
 ║                                                ║
+║ Next hours: {strip}
 ║ ────────────────────────────────────────────── ║
 ║ Recommended Clothing:                          ║
 ║ {clothing}                                     
 ╚════════════════════════════════════════════════╝
 """
-                else:
-                    return None
-            except:
-                return None
-
-        # Try fetching weather data from wttr.in first
-        weather_data = fetch_from_wttr()
 
-        if weather_data is None:
-            # If wttr.in fails, try fetching from Open-Meteo
-            weather_data = fetch_from_open_meteo()
-
-        if weather_data is None:
-            # If both APIs fail, return an error message
-            return "Weather data unavailable from both sources."
-
-        return weather_data
-
-    def get_lat_lon_from_ip(self):
+    def get_lat_lon_from_ip(self, ip_data=None):
         """Get latitude and longitude based on IP address."""
         try:
-            ip_data = requests.get("http://ipinfo.io").json()
+            if ip_data is None:
+                ip_data = requests.get("http://ipinfo.io").json()
             loc = ip_data.get('loc', '0,0').split(',')
             return loc[0], loc[1]
         except:
@@ -461,16 +776,17 @@ class DashboardApp:
         if not stock_symbols or stock_symbols == ['']:
             return "No stocks configured in ~/.config/dailyapp/conf.conf"
 
-        stock_info = []
+        stock_info = [f"║ Source: {self.quote_backend.name}"]
+        if self.quote_backend_notice:
+            stock_info.append(f"║ Note: {self.quote_backend_notice}")
         for symbol in stock_symbols:
-            stock = yf.Ticker(symbol.strip())
-            try:
-                price = stock.history(period="1d")['Close'].iloc[-1]
+            price = self.quote_backend.get_price(symbol.strip())
+            if price is not None:
                 stock_info.append(f"║ {symbol.strip()}: ${price:.2f}")
-            except (KeyError, IndexError):
+            else:
                 stock_info.append(f"║ {symbol.strip()}: Data not available")
 
-        stock_content = "\n".join(stock_info) if stock_info else "No stock data available."
+        stock_content = "\n".join(stock_info)
 
         return f"""
 ╔════════════════════════════════════════════════╗
@@ -478,13 +794,44 @@ class DashboardApp:
 ╠════════════════════════════════════════════════╣
 {stock_content}
 ╚════════════════════════════════════════════════╝
+"""
+
+    def filesystems_info(self):
+        mounts, usage, stuck, io_rates = self.fs_collector.snapshot()
+
+        fs_info = []
+        for mountpoint in sorted(mounts):
+            fstype = mounts[mountpoint]
+            if mountpoint in stuck:
+                fs_info.append(f"║ {mountpoint} ({fstype}): STUCK, no response for {stuck[mountpoint]:.0f}s")
+            elif mountpoint in usage:
+                disk = usage[mountpoint]
+                fs_info.append(f"║ {mountpoint} ({fstype}): {disk.percent}% of {disk.total / (1024 ** 3):.1f}GB")
+            else:
+                fs_info.append(f"║ {mountpoint} ({fstype}): Checking...")
+
+        if io_rates:
+            fs_info.append("║ ────────────────────────────────────────────── ║")
+            for device in sorted(io_rates):
+                read_rate, write_rate = io_rates[device]
+                fs_info.append(f"║ {device}: R {read_rate / (1024 * 1024):.2f}MB/s W {write_rate / (1024 * 1024):.2f}MB/s")
+
+        fs_content = "\n".join(fs_info) if fs_info else "║ No filesystems found."
+
+        return f"""
+╔════════════════════════════════════════════════╗
+║                  Filesystems                   ║
+╠════════════════════════════════════════════════╣
+{fs_content}
+╚════════════════════════════════════════════════╝
 """
 
     def auto_refresh_weather(self):
-        """Auto-refresh weather every 30 minutes."""
+        """Re-render weather every minute from the cached forecast and re-download it every few hours."""
         while True:
+            time.sleep(60)  # Refresh every minute
+            self.update_forecast()
             self.weather_data = self.weather_info()
-            time.sleep(1800)  # Refresh every 30 minutes
 
     def auto_refresh_stocks(self):
         """Auto-refresh stocks every 5 minutes."""
@@ -492,6 +839,12 @@ class DashboardApp:
             self.stock_data = self.stocks_info()
             time.sleep(300)  # Refresh every 5 minutes
 
+    def auto_refresh_filesystems(self):
+        """Auto-refresh filesystem usage and disk I/O every second; hung mounts are only marked stuck."""
+        while True:
+            self.fs_collector.collect()
+            time.sleep(1)
+
     def draw_tiling(self):
         self.stdscr.clear()
         height, width = self.stdscr.getmaxyx()
@@ -575,6 +928,9 @@ class DashboardApp:
         elif self.active_window == 3:
             # Stocks window
             self.display_in_window(self.stdscr, 2, 0, self.stock_data)
+        elif self.active_window == 4:
+            # Filesystems window
+            self.display_in_window(self.stdscr, 2, 0, self.filesystems_info())
         else:
             content = window_func()
             self.display_in_window(self.stdscr, 2, 0, content)